@@ -7,34 +7,115 @@
 try:
     import yfinance as yf
     import pandas as pd
+    import numpy as np
     import requests
+    from requests.adapters import HTTPAdapter
     from zoneinfo import ZoneInfo
 except ImportError:
     print("Required packages are not installed. Please install them using: pip install yfinance pandas requests tzdata")
     exit(1)
 
+try:
+    # Optional: needed for --daemon, which keeps the script running instead of relaunching it from cron
+    from apscheduler.schedulers.blocking import BlockingScheduler
+except ImportError:
+    BlockingScheduler = None
+
 import os
+import atexit
 import argparse
 import datetime
 import csv
+import json
+import io
+import bisect
+import threading
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 
 # CONFIGURATION
 # =============
 # Set the interval for fetching data (e.g., '1m', '5m', '15m')
 DATA_INTERVAL = '5m'
 
+# Seconds between checks when running with --daemon
+DAEMON_INTERVAL = 60
+
 # Set the log file path
 LOG_FILE = "stock_monitor.log"
 
+# File that records when the last alert was sent for each ticker
+ALERT_STATE_FILE = "alert_state.json"
+API_LOG_FILE = "api_log.txt"
+# Size of the write buffer for api_log.txt, which is flushed at the end of each run.
+# LOG_FILE is line-buffered so alerts reach the disk as soon as they are logged.
+LOG_BUFFER_SIZE = 1 << 16
+
 DEFAULT_THRESHOLD = 0.5
 DEFAULT_ALERT_FREQUENCY = 'daily'
 
+# Columns of watchlist.txt, in order, and the accepted values for the text columns
+WATCHLIST_COLUMNS = ['ticker', 'threshold', 'direction', 'price_below', 'price_above', 'alert_frequency']
+VALID_DIRECTIONS = frozenset({'gain', 'drop', 'both'})
+VALID_ALERT_FREQUENCIES = frozenset({'once', 'daily', 'weekly', 'monthly'})
+
+# Maximum number of symbols Yahoo accepts in a single batched download
+YAHOO_BATCH_SIZE = 20
+# Maximum number of concurrent requests to Yahoo. Higher values risk hitting Yahoo's per-IP rate limit.
+MAX_DOWNLOAD_WORKERS = 8
+
+# Yahoo Finance quote endpoint, which returns prices for many symbols in one request
+YAHOO_QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
+# Maximum number of symbols sent to the quote endpoint per request
+YAHOO_QUOTE_BATCH_SIZE = 100
+# The quote endpoint may refuse requests without yfinance's cookie and crumb. After a refusal,
+# skip it for this long and get prices from the chart endpoint and yfinance instead.
+YAHOO_QUOTE_REFUSED_BACKOFF = datetime.timedelta(minutes=15)
+# HTTP statuses Yahoo answers with when it refuses a request
+YAHOO_REFUSED_STATUSES = frozenset({401, 403, 429})
+# Yahoo Finance spark endpoint, which returns compact close-only series for many symbols
+YAHOO_SPARK_URL = "https://query1.finance.yahoo.com/v7/finance/spark"
+# Yahoo Finance chart endpoint for a single symbol, appended to this URL
+YAHOO_CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/"
+# Yahoo rejects requests that don't look like they come from a browser
+YAHOO_HEADERS = {"User-Agent": "Mozilla/5.0"}
+
 # PUSHOVER CONFIGURATION
 # ======================
 # Your Pushover User Key
 PUSHOVER_USER_KEY = ""
 # Your Pushover API Token
 PUSHOVER_API_TOKEN = ""
+# Pushover rejects messages longer than this, so batched alerts are split to fit
+PUSHOVER_MAX_MESSAGE_LENGTH = 1024
+# Maximum number of notifications sent to Pushover at the same time
+PUSHOVER_MAX_WORKERS = 8
+
+# Alert messages queued per ticker by log_alert during a run, sent together by _flush_alerts
+_PENDING_ALERTS = {}
+
+# Shared HTTP session for Pushover and direct Yahoo requests, so repeated requests reuse
+# keep-alive TLS connections. The pool is sized for the concurrent requests.
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# Log files are opened on first use and kept open for the rest of the run.
+# The locks serialize writes when requests are made from worker threads.
+_LOG_FH = None
+_API_LOG_FH = None
+_LOG_LOCK = threading.Lock()
+_API_LOG_LOCK = threading.Lock()
+
+def _map_concurrent(func, items, max_workers):
+    """
+    Returns [func(item) for item in items], running the calls on a thread pool of up to
+    max_workers threads. A single item is called directly, since small watchlists usually
+    need just one request and starting a pool for it is pure overhead.
+    """
+    if len(items) <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(func, items))
 
 def send_pushover_notification(message):
     """
@@ -46,7 +127,7 @@ def send_pushover_notification(message):
         return False # Return False if skipped
 
     try:
-        response = requests.post("https://api.pushover.net/1/messages.json", data={
+        response = _HTTP_SESSION.post("https://api.pushover.net/1/messages.json", data={
             "token": PUSHOVER_API_TOKEN,
             "user": PUSHOVER_USER_KEY,
             "message": message,
@@ -58,65 +139,183 @@ def send_pushover_notification(message):
         print(f"Could not send Pushover notification: {e}")
         return False # Return False on failure
 
-def create_alert_file(ticker, message):
+def _migrate_alert_files():
     """
-    Creates a file in the alerts directory to log the alert.
+    Reads alert state from the per-ticker files in the alerts directory used by older versions.
+    Returns a dictionary in the same format as ALERT_STATE_FILE.
     """
-    if not os.path.exists("alerts"):
-        os.makedirs("alerts")
-    
-    alert_file_path = os.path.join("alerts", f"{ticker}.txt")
-    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open(alert_file_path, "w") as f:
-        f.write(f"Alert sent ({timestamp})\n")
-        f.write(message + "\n")
+    state = {}
+    if not os.path.isdir("alerts"):
+        return state
+
+    for file_name in os.listdir("alerts"):
+        if not file_name.endswith(".txt"):
+            continue
+        # Tickers are upper-cased when the watchlist is parsed
+        ticker = file_name[:-len(".txt")].upper()
+        with open(os.path.join("alerts", file_name), "r") as f:
+            first_line = f.readline()
+            message = f.read().rstrip("\n")
+        try:
+            last_alert_str = first_line.split('(')[1].split(')')[0]
+            timestamp = datetime.datetime.strptime(last_alert_str, '%Y-%m-%d %H:%M:%S').isoformat()
+        except (ValueError, IndexError):
+            # Malformed files let the next alert through
+            timestamp = None
+        state[ticker] = {"timestamp": timestamp, "message": message}
+    return state
+
+def _load_alert_state():
+    """
+    Loads the alert state from ALERT_STATE_FILE, migrating the old alerts directory if the
+    file doesn't exist yet. Returns a dictionary of ticker to {"timestamp", "message"}.
+    """
+    try:
+        with open(ALERT_STATE_FILE, "r") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return _migrate_alert_files()
+    except ValueError as e:
+        print(f"Could not read {ALERT_STATE_FILE}: {e}. Starting with no alert history.")
+        return {}
+
+def _alert_state_mtime():
+    """
+    Returns the modification time of ALERT_STATE_FILE, or None if it doesn't exist.
+    """
+    try:
+        return os.path.getmtime(ALERT_STATE_FILE)
+    except FileNotFoundError:
+        return None
+
+def _save_alert_state():
+    """
+    Writes the alert state to ALERT_STATE_FILE if it changed since it was last saved.
+    The file is replaced atomically so an interrupted write can't corrupt the alert history.
+    """
+    global _ALERT_STATE_DIRTY, _ALERT_STATE_MTIME
+    if not _ALERT_STATE_DIRTY:
+        return
+    temp_path = ALERT_STATE_FILE + ".tmp"
+    with open(temp_path, "w") as f:
+        json.dump(_ALERT_STATE, f, indent=2)
+    os.replace(temp_path, ALERT_STATE_FILE)
+    _ALERT_STATE_DIRTY = False
+    _ALERT_STATE_MTIME = _alert_state_mtime()
+
+# Last alert per ticker, loaded on first use. Changes are saved after each batch of
+# notifications, with a final save at exit as a fallback.
+_ALERT_STATE = None
+_ALERT_STATE_DIRTY = False
+# Modification time of ALERT_STATE_FILE when it was last loaded or saved
+_ALERT_STATE_MTIME = None
+
+def _get_alert_state():
+    """
+    Returns the in-memory alert state, loading it on first use.
+    The file is reloaded if it was edited since (e.g. to reset a 'once' alert), which costs
+    a single stat call; unsaved changes in memory take precedence.
+    """
+    global _ALERT_STATE, _ALERT_STATE_DIRTY, _ALERT_STATE_MTIME
+    if _ALERT_STATE is None:
+        _ALERT_STATE_MTIME = _alert_state_mtime()
+        _ALERT_STATE = _load_alert_state()
+        # State migrated from the old alerts directory hasn't been written to ALERT_STATE_FILE yet
+        _ALERT_STATE_DIRTY = bool(_ALERT_STATE) and _ALERT_STATE_MTIME is None
+        atexit.register(_save_alert_state)
+    elif not _ALERT_STATE_DIRTY:
+        mtime = _alert_state_mtime()
+        if mtime is not None and mtime != _ALERT_STATE_MTIME:
+            # Keep the current state if the file is unreadable (e.g. caught mid-save by an
+            # editor), and leave the mtime alone so the next call tries again
+            try:
+                with open(ALERT_STATE_FILE, "r") as f:
+                    _ALERT_STATE = json.load(f)
+                _ALERT_STATE_MTIME = mtime
+            except (OSError, ValueError) as e:
+                print(f"Could not reload {ALERT_STATE_FILE}: {e}. Keeping the current alert history.")
+    return _ALERT_STATE
+
+def record_alert(ticker, message):
+    """
+    Records that an alert was sent for a ticker.
+    """
+    global _ALERT_STATE_DIRTY
+    _get_alert_state()[ticker] = {
+        "timestamp": datetime.datetime.now().replace(microsecond=0).isoformat(),
+        "message": message,
+    }
+    _ALERT_STATE_DIRTY = True
+
+# Parsed last-alert time per ticker, as (timestamp string, datetime), so repeated
+# checks only parse a ticker's timestamp again after it changes
+_PARSED_TIMESTAMPS = {}
+
+def _last_alert_time(ticker, timestamp):
+    """
+    Returns the datetime for a ticker's last-alert timestamp, reusing the previous parse
+    if the timestamp hasn't changed. Raises TypeError or ValueError if it's malformed.
+    """
+    cached = _PARSED_TIMESTAMPS.get(ticker)
+    if cached is not None and cached[0] == timestamp:
+        return cached[1]
+    last_alert_date = datetime.datetime.fromisoformat(timestamp)
+    _PARSED_TIMESTAMPS[ticker] = (timestamp, last_alert_date)
+    return last_alert_date
 
 def should_send_alert(ticker, frequency):
     """
     Checks if an alert should be sent based on the alert frequency, using calendar-based checks.
     """
-    alert_file_path = os.path.join("alerts", f"{ticker}.txt")
-    if not os.path.exists(alert_file_path):
+    alert_state = _get_alert_state()
+    if ticker not in alert_state:
         return True # First time, always send
 
     if frequency == 'once':
         return False # Only send once
 
-    with open(alert_file_path, "r") as f:
-        first_line = f.readline()
-        if "Alert sent" in first_line:
-            try:
-                last_alert_str = first_line.split('(')[1].split(')')[0]
-                last_alert_date = datetime.datetime.strptime(last_alert_str, '%Y-%m-%d %H:%M:%S')
-                now = datetime.datetime.now()
-
-                # Calendar-based checks
-                if frequency == 'daily' and now.date() > last_alert_date.date():
-                    return True
-                # For weekly and monthly, we need to consider the year as well
-                if frequency == 'weekly':
-                    # Check if it's a different week or a different year
-                    if now.isocalendar().year != last_alert_date.isocalendar().year or \
-                       now.isocalendar().week != last_alert_date.isocalendar().week:
-                        return True
-                if frequency == 'monthly':
-                    # Check if it's a different month or a different year
-                    if now.year != last_alert_date.year or now.month != last_alert_date.month:
-                        return True
-            except (ValueError, IndexError):
-                # If the file is malformed, allow sending the alert
-                return True
-    
+    try:
+        last_alert_date = _last_alert_time(ticker, alert_state[ticker]["timestamp"])
+    except (TypeError, ValueError, KeyError):
+        # If the entry is malformed, allow sending the alert
+        return True
+
+    now = datetime.datetime.now()
+
+    # Calendar-based checks
+    if frequency == 'daily' and now.date() > last_alert_date.date():
+        return True
+    # For weekly and monthly, we need to consider the year as well
+    if frequency == 'weekly':
+        # Check if it's a different week or a different year
+        now_week = now.isocalendar()
+        last_week = last_alert_date.isocalendar()
+        if now_week.year != last_week.year or now_week.week != last_week.week:
+            return True
+    if frequency == 'monthly':
+        # Check if it's a different month or a different year
+        if now.year != last_alert_date.year or now.month != last_alert_date.month:
+            return True
+
     return False
 
-def log_alert(message, ticker, frequency):
+def _format_timestamp(now):
     """
-    Logs an alert message to the console, to a log file, and sends a push notification.
+    Formats a datetime as 'YYYY-MM-DD HH:MM:SS' for the log files, without strftime's locale handling.
+    """
+    return f"{now.year:04d}-{now.month:02d}-{now.day:02d} {now.hour:02d}:{now.minute:02d}:{now.second:02d}"
+
+def log_alert(message, ticker, frequency, timestamp=None):
+    """
+    Logs an alert message to the console and to a log file, and queues a push notification.
     If an alert is skipped due to frequency, it still prints the current price and relevant details.
-    Only creates an alert file if Pushover notification is successful.
+    Queued notifications are sent by _flush_alerts, which only records the alert if the
+    Pushover notification is successful.
+    timestamp is the pre-formatted time of the check; it defaults to now.
     """
     should_send = should_send_alert(ticker, frequency)
-    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    if timestamp is None:
+        timestamp = _format_timestamp(datetime.datetime.now())
     log_entry_message = f"[{timestamp}] {message}" # This is what goes into the log file
 
     if not should_send:
@@ -124,30 +323,90 @@ def log_alert(message, ticker, frequency):
         # Print the details that would have been in the alert.
         print(f"Details: {message}")
         # Always append to LOG_FILE, even if skipped
-        with open(LOG_FILE, "a") as f:
-            f.write(log_entry_message + "\n")
+        _write_log(log_entry_message)
         return # Exit after handling skipped alert
 
     # If we reach here, the alert should be sent.
     print(log_entry_message) # Print the timestamped log message to console
-    
-    # Send Pushover notification and check for success
-    pushover_success = send_pushover_notification(message)
 
     # Always append to LOG_FILE if should_send is True
-    with open(LOG_FILE, "a") as f:
-        f.write(log_entry_message + "\n")
+    _write_log(log_entry_message)
+
+    # Queue the notification so all alerts from this run go out in as few requests as possible
+    # Identical messages for a ticker within one run are only sent once
+    pending = _PENDING_ALERTS.setdefault(ticker, [])
+    if message not in pending:
+        pending.append(message)
+
+def _flush_alerts():
+    """
+    Sends all queued alerts as one notification section per ticker, packing as many
+    tickers as fit into each Pushover message.
+    Records the alert for each ticker only once its notification was sent successfully.
+    """
+    separator = "\n---\n"
+    batches = []
+    for ticker, messages in _PENDING_ALERTS.items():
+        message = "\n".join(messages)
+        if batches and len(batches[-1][0]) + len(separator) + len(message) <= PUSHOVER_MAX_MESSAGE_LENGTH:
+            batches[-1][0] += separator + message
+            batches[-1][1].append((ticker, message))
+        else:
+            batches.append([message, [(ticker, message)]])
+    _PENDING_ALERTS.clear()
+
+    # Send the batches concurrently over the shared keep-alive session. They can arrive on the
+    # phone out of watchlist order; the alerts are still recorded in order below.
+    sent = _map_concurrent(send_pushover_notification, [body for body, _ in batches], PUSHOVER_MAX_WORKERS)
+
+    for (_, alerts), success in zip(batches, sent):
+        if not success:
+            continue
+        for ticker, message in alerts:
+            record_alert(ticker, message)
+
+    _save_alert_state()
+
+def _open_log_file(path, buffering):
+    """
+    Opens a log file for appending with the given buffering and makes sure it is closed at exit.
+    """
+    fh = open(path, "a", buffering=buffering)
+    atexit.register(fh.close)
+    return fh
+
+def _write_log(message):
+    """
+    Appends a line to LOG_FILE. Safe to call from multiple threads.
+    """
+    global _LOG_FH
+    with _LOG_LOCK:
+        if _LOG_FH is None:
+            _LOG_FH = _open_log_file(LOG_FILE, buffering=1)
+        _LOG_FH.write(message + "\n")
 
-    # Only create alert file if Pushover was successful
-    if pushover_success:
-        create_alert_file(ticker, message)
 def log_api(message):
     """
     Logs an API request/response to api_log.txt.
+    Safe to call from multiple threads.
     """
-    with open("api_log.txt", "a") as f:
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        f.write(f"[{timestamp}] {message}\n")
+    global _API_LOG_FH
+    timestamp = _format_timestamp(datetime.datetime.now())
+    with _API_LOG_LOCK:
+        if _API_LOG_FH is None:
+            _API_LOG_FH = _open_log_file(API_LOG_FILE, buffering=LOG_BUFFER_SIZE)
+        _API_LOG_FH.write(f"[{timestamp}] {message}\n")
+
+def _flush_logs():
+    """
+    Writes any buffered log lines out to disk.
+    """
+    with _LOG_LOCK:
+        if _LOG_FH is not None:
+            _LOG_FH.flush()
+    with _API_LOG_LOCK:
+        if _API_LOG_FH is not None:
+            _API_LOG_FH.flush()
 
 def test_pushover():
     """
@@ -156,43 +415,41 @@ def test_pushover():
     print("Sending test notification to Pushover...")
     send_pushover_notification("This is a test notification from the stock monitor script.")
 
-def parse_watchlist():
+def _parse_watchlist_rows():
     """
-    Parses the watchlist.txt file, returning a dictionary of tickers and their configurations.
-    Hardened for robustness.
+    Parses the watchlist.txt file row by row, returning a dictionary of tickers and their configurations.
+    Hardened for robustness: invalid fields are reported and replaced with defaults.
     """
     watchlist = {}
     try:
         with open("watchlist.txt", "r") as f:
+            # Drop comment lines before the csv module splits them into fields
+            lines = (line for line in f if not line.lstrip().startswith('#'))
             # 1. Use skipinitialspace=True
-            reader = csv.reader(f, skipinitialspace=True)
-            
-            # Read all rows into a list to allow multiple passes if needed
-            all_rows = list(reader)
-            
-            header_index = -1
-            # Find the header row index
-            for i, row in enumerate(all_rows):
-                if row and row[0].strip() == 'TICKER':
-                    header_index = i
-                    break
-            
-            rows_to_process = all_rows
-            if header_index != -1:
-                # If header found, process rows after it
-                rows_to_process = all_rows[header_index + 1:]
-            else:
-                print("Warning: 'TICKER' header not found in watchlist.txt. Processing all rows as data.")
-                # If no header, process all rows. `rows_to_process` is already `all_rows`.
-
-            # Process the relevant rows
-            for row in rows_to_process:
-                # Skip comments and blank lines
-                if not row or row[0].strip().startswith('#'):
+            reader = csv.reader(lines, skipinitialspace=True)
+
+            # Rows are processed in a single pass; the first non-comment row may be the header
+            header_checked = False
+            for row in reader:
+                # Strip every field once
+                stripped = [c.strip() for c in row]
+
+                # Skip blank lines and comments
+                if not stripped or stripped[0].startswith('#'):
                     continue
 
+                if not header_checked:
+                    header_checked = True
+                    if stripped[0] == 'TICKER':
+                        continue
+                    print("Warning: 'TICKER' header not found in watchlist.txt. Processing all rows as data.")
+
+                # Pad missing optional columns with empty strings
+                stripped += [''] * (6 - len(stripped))
+
                 # 4. Compute and use stripped ticker once, reject if empty
-                ticker = row[0].strip()
+                # yfinance and Yahoo's batched endpoints return symbols upper-cased
+                ticker = stripped[0].upper()
                 if not ticker:
                     print(f"Warning: Skipping row with empty ticker: {row}")
                     continue
@@ -200,43 +457,37 @@ def parse_watchlist():
                 # Parse threshold
                 try:
                     # 3. Guarded float conversion for threshold
-                    threshold_str = row[1].strip() if len(row) > 1 else None
-                    if threshold_str:
-                        threshold = float(threshold_str)
-                    else:
-                        threshold = DEFAULT_THRESHOLD # Default if missing
+                    threshold = float(stripped[1]) if stripped[1] else DEFAULT_THRESHOLD # Default if missing
                 except ValueError:
-                    print(f"Warning: Invalid threshold '{row[1].strip()}' for ticker {ticker}. Using default threshold {DEFAULT_THRESHOLD}.")
+                    print(f"Warning: Invalid threshold '{stripped[1]}' for ticker {ticker}. Using default threshold {DEFAULT_THRESHOLD}.")
                     threshold = DEFAULT_THRESHOLD
 
-                direction = row[2].strip().lower() if len(row) > 2 and row[2].strip() else 'both'
+                direction = stripped[2].lower() or 'both'
                 
                 # 3. Wrap parsing of price_below and price_above in guarded float conversion
                 price_below = None
                 try:
-                    price_below_str = row[3].strip() if len(row) > 3 else None
-                    if price_below_str:
-                        price_below = float(price_below_str)
+                    if stripped[3]:
+                        price_below = float(stripped[3])
                 except ValueError:
-                    print(f"Warning: Invalid price_below '{row[3].strip()}' for ticker {ticker}. Defaulting to None.")
+                    print(f"Warning: Invalid price_below '{stripped[3]}' for ticker {ticker}. Defaulting to None.")
                     price_below = None # Explicitly set to None on failure
 
                 price_above = None
                 try:
-                    price_above_str = row[4].strip() if len(row) > 4 else None
-                    if price_above_str:
-                        price_above = float(price_above_str)
+                    if stripped[4]:
+                        price_above = float(stripped[4])
                 except ValueError:
-                    print(f"Warning: Invalid price_above '{row[4].strip()}' for ticker {ticker}. Defaulting to None.")
+                    print(f"Warning: Invalid price_above '{stripped[4]}' for ticker {ticker}. Defaulting to None.")
                     price_above = None # Explicitly set to None on failure
 
-                alert_frequency = row[5].strip().lower() if len(row) > 5 and row[5].strip() else DEFAULT_ALERT_FREQUENCY
+                alert_frequency = stripped[5].lower() or DEFAULT_ALERT_FREQUENCY
 
-                if direction not in ['gain', 'drop', 'both']:
+                if direction not in VALID_DIRECTIONS:
                     print(f"Invalid direction '{direction}' for ticker {ticker}. Defaulting to 'both'.")
                     direction = 'both'
                 
-                if alert_frequency not in ['once', 'daily', 'weekly', 'monthly']:
+                if alert_frequency not in VALID_ALERT_FREQUENCIES:
                     print(f"Invalid alert frequency '{alert_frequency}' for ticker {ticker}. Defaulting to '{DEFAULT_ALERT_FREQUENCY}'.")
                     alert_frequency = DEFAULT_ALERT_FREQUENCY
 
@@ -252,6 +503,122 @@ def parse_watchlist():
     
     return watchlist
 
+def _parse_watchlist_pandas():
+    """
+    Parses the watchlist.txt file with pandas, returning a dictionary of tickers and their configurations.
+    Raises ValueError if the file has anything that needs a warning (invalid numbers, directions,
+    frequencies or empty tickers), so that parse_watchlist can fall back to the row-by-row parser.
+    """
+    # Drop comment lines the same way as the row-by-row parser. pandas' comment='#' would also
+    # cut inline comments, which the row-by-row parser treats as part of the field.
+    with open("watchlist.txt", "r") as f:
+        lines = "".join(line for line in f if not line.lstrip().startswith('#'))
+    df = pd.read_csv(io.StringIO(lines), names=WATCHLIST_COLUMNS, header=None, index_col=False,
+                     skipinitialspace=True, dtype=str, keep_default_na=False, na_values=[''])
+    df = df.apply(lambda column: column.str.strip()).replace('', np.nan)
+    # An empty or comment-only file has no header to warn about, as in the row-by-row parser
+    if df.empty:
+        return {}
+
+    has_header = df['ticker'].iloc[0] == 'TICKER'
+    if has_header:
+        df = df.iloc[1:]
+
+    if df['ticker'].isna().any():
+        raise ValueError("empty ticker")
+    # yfinance and Yahoo's batched endpoints return symbols upper-cased
+    df['ticker'] = df['ticker'].str.upper()
+    if df['ticker'].str.startswith('#').any():
+        raise ValueError("quoted comment")
+
+    # pd.to_numeric raises ValueError on anything that isn't a number. Columns of whole
+    # numbers come back as integers, so cast to float like the row-by-row parser.
+    for column in ('threshold', 'price_below', 'price_above'):
+        df[column] = pd.to_numeric(df[column]).astype(float)
+    df['threshold'] = df['threshold'].fillna(DEFAULT_THRESHOLD)
+    df['direction'] = df['direction'].str.lower().fillna('both')
+    df['alert_frequency'] = df['alert_frequency'].str.lower().fillna(DEFAULT_ALERT_FREQUENCY)
+
+    if not df['direction'].isin(VALID_DIRECTIONS).all():
+        raise ValueError("invalid direction")
+    if not df['alert_frequency'].isin(VALID_ALERT_FREQUENCIES).all():
+        raise ValueError("invalid alert frequency")
+
+    if not has_header:
+        print("Warning: 'TICKER' header not found in watchlist.txt. Processing all rows as data.")
+
+    df = df.astype(object).where(df.notna(), None)
+    watchlist = {}
+    for row in df.to_dict('records'):
+        ticker = row.pop('ticker')
+        row['threshold'] = float(row['threshold'])
+        # Later rows override earlier ones for the same ticker, as in the row-by-row parser
+        watchlist[ticker] = row
+    return watchlist
+
+# Last parsed watchlist, the modification time of watchlist.txt it was parsed from,
+# and its array form built by _watchlist_arrays
+_WATCHLIST_CACHE = {'mtime': None, 'data': None, 'arrays': None}
+
+def parse_watchlist():
+    """
+    Parses the watchlist.txt file, returning a dictionary of tickers and their configurations.
+    Well-formed files are parsed with pandas; anything else goes through the row-by-row parser,
+    which reports each problem and falls back to defaults.
+    The result is reused until watchlist.txt is modified.
+    """
+    try:
+        mtime = os.path.getmtime("watchlist.txt")
+    except FileNotFoundError:
+        print("watchlist.txt not found.")
+        return {}
+    if mtime == _WATCHLIST_CACHE['mtime']:
+        return _WATCHLIST_CACHE['data']
+
+    try:
+        watchlist = _parse_watchlist_pandas()
+    except FileNotFoundError:
+        print("watchlist.txt not found.")
+        return {}
+    except (ValueError, pd.errors.ParserError):
+        watchlist = _parse_watchlist_rows()
+
+    _WATCHLIST_CACHE['mtime'] = mtime
+    _WATCHLIST_CACHE['data'] = watchlist
+    _WATCHLIST_CACHE['arrays'] = None
+    return watchlist
+
+def _download_batched(tickers, apilog=False, **download_kwargs):
+    """
+    Downloads historical data for many tickers, YAHOO_BATCH_SIZE symbols per yf.download call.
+    Returns one DataFrame with a (ticker, field) column index. Batches that fail are reported
+    and left out, so their tickers are simply missing from the result.
+    """
+    chunks = [tickers[i:i + YAHOO_BATCH_SIZE] for i in range(0, len(tickers), YAHOO_BATCH_SIZE)]
+    request_args = ", ".join(f"{key}={value!r}" for key, value in download_kwargs.items())
+
+    def download_chunk(chunk):
+        tickers_string = " ".join(chunk)
+        try:
+            if apilog:
+                log_api(f"Request: yf.download(tickers={tickers_string}, {request_args})")
+            data = yf.download(tickers=tickers_string, auto_adjust=True, progress=False, group_by='ticker', threads=True, **download_kwargs)
+            if apilog:
+                log_api(f"Response: Received {len(data)} rows of data.")
+            return data
+        except Exception as e:
+            print(f"Could not download data for {tickers_string}: {e}")
+            return None
+
+    # The batches are network-bound, so fetch them concurrently
+    frames = [frame for frame in _map_concurrent(download_chunk, chunks, MAX_DOWNLOAD_WORKERS) if frame is not None]
+
+    if not frames:
+        return pd.DataFrame()
+    if len(frames) == 1:
+        return frames[0]
+    return pd.concat(frames, axis=1)
+
 def analyze_stocks(args):
     """
     Analyzes the stocks in the watchlist to determine how many alerts would have been triggered
@@ -265,78 +632,363 @@ def analyze_stocks(args):
     print("Analyzing stocks... This may take a minute or two.")
 
     thresholds_to_analyze = [0.1, 0.5, 1.0, 2.0, 3.0, 4.0, 5.0]
+    # float32 is plenty for counting percent changes and halves the memory the comparison scans
+    threshold_array = np.asarray(thresholds_to_analyze, dtype=np.float32)
+
+    # Download everything up front, then analyze and print in watchlist order
+    data = _download_batched(list(watchlist), args.apilog, period="1mo", interval=DATA_INTERVAL)
 
     for ticker in watchlist.keys():
         print(f"\n--- Analyzing {ticker} ---")
         try:
-            # Download historical data for the last month
-            if args.apilog:
-                log_api(f"Request: yf.download(ticker={ticker}, period='1mo', interval={DATA_INTERVAL})")
-            data = yf.download(ticker, period="1mo", interval=DATA_INTERVAL, auto_adjust=True, progress=False)
-            if args.apilog:
-                log_api(f"Response: Received {len(data)} rows of data.")
+            if data.empty or ticker not in data.columns.get_level_values(0):
+                print(f"Could not get historical data for {ticker}.")
+                continue
 
-            if data.empty:
+            # Rows where other tickers in the batch traded but this one did not are NaN
+            close = data[ticker]['Close'].to_numpy(dtype=np.float32)
+            close = close[~np.isnan(close)]
+            if close.size == 0:
                 print(f"Could not get historical data for {ticker}.")
                 continue
 
-            # Calculate percentage change
-            data['Percent Change'] = data['Close'].pct_change() * 100
+            # Calculate the percentage change between consecutive bars directly in NumPy and
+            # count every threshold in one broadcast comparison of shape (rows, thresholds)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                abs_pct = np.abs(np.diff(close) / close[:-1]) * 100
+            counts = (abs_pct[:, None] > threshold_array[None, :]).sum(axis=0)
 
-            for threshold in thresholds_to_analyze:
-                alerts = data[abs(data['Percent Change']) > threshold]
-                print(f"Alerts in the last month at {threshold}% threshold: {len(alerts)}")
+            for threshold, count in zip(thresholds_to_analyze, counts):
+                print(f"Alerts in the last month at {threshold}% threshold: {int(count)}")
 
-        except requests.exceptions.RequestException as e:
-            print(f"Could not download data for {ticker}: {e}")
         except (KeyError, ValueError) as e:
             print(f"Could not analyze data for {ticker}: {e}")
         except Exception as e:
             print(f"An unexpected error occurred while analyzing {ticker}: {e}")
             raise
 
+    _flush_logs()
+
+# Market session boundaries in Eastern Time, and the session that starts at each one
+MARKET_TIMEZONE = ZoneInfo("America/New_York")
+_SESSION_BOUNDARIES = (
+    datetime.time(4, 0),   # pre-market start
+    datetime.time(9, 30),  # market start
+    datetime.time(16, 0),  # market end
+    datetime.time(20, 0),  # post-market end
+)
+_SESSIONS = ("closed", "pre-market", "regular", "post-market", "closed")
+
 def get_market_session():
     """
     Determines the current market session (pre-market, regular, post-market).
     """
-    now = datetime.datetime.now(ZoneInfo("America/New_York")).time()
-    pre_market_start = datetime.time(4, 0)
-    market_start = datetime.time(9, 30)
-    market_end = datetime.time(16, 0)
-    post_market_end = datetime.time(20, 0)
-
-    if pre_market_start <= now < market_start:
-        return "pre-market"
-    elif market_start <= now < market_end:
-        return "regular"
-    elif market_end <= now < post_market_end:
-        return "post-market"
+    now = datetime.datetime.now(MARKET_TIMEZONE).time()
+    return _SESSIONS[bisect.bisect_right(_SESSION_BOUNDARIES, now)]
+
+# Time until which the quote endpoint is skipped after Yahoo refused a request, or None
+_QUOTE_REFUSED_UNTIL = None
+
+def _fetch_quotes_v7(symbols, apilog=False):
+    """
+    Fetches quotes for all symbols from Yahoo's v7 quote endpoint, YAHOO_QUOTE_BATCH_SIZE
+    symbols per request over the shared keep-alive session.
+    Returns a dictionary of symbol to quote; symbols in a batch that failed are omitted.
+    If Yahoo refuses a request, the endpoint is skipped for YAHOO_QUOTE_REFUSED_BACKOFF, so
+    the symbols not fetched yet go through the fallbacks in get_current_prices.
+    """
+    global _QUOTE_REFUSED_UNTIL
+    now = datetime.datetime.now()
+    if _QUOTE_REFUSED_UNTIL is not None and now < _QUOTE_REFUSED_UNTIL:
+        return {}
+
+    quotes = {}
+    for i in range(0, len(symbols), YAHOO_QUOTE_BATCH_SIZE):
+        symbols_string = ",".join(symbols[i:i + YAHOO_QUOTE_BATCH_SIZE])
+        try:
+            if apilog:
+                log_api(f"Request: GET {YAHOO_QUOTE_URL}?symbols={symbols_string}")
+            response = _HTTP_SESSION.get(YAHOO_QUOTE_URL, params={"symbols": symbols_string}, headers=YAHOO_HEADERS, timeout=10)
+            if response.status_code in YAHOO_REFUSED_STATUSES:
+                _QUOTE_REFUSED_UNTIL = now + YAHOO_QUOTE_REFUSED_BACKOFF
+                print(f"Yahoo refused the quote request (HTTP {response.status_code}). "
+                      f"Using the chart endpoint and yfinance for prices until {_QUOTE_REFUSED_UNTIL:%H:%M}.")
+                break
+            response.raise_for_status()
+            result = response.json()['quoteResponse']['result']
+            if apilog:
+                log_api(f"Response: Received {len(result)} quotes.")
+            # Build the batch first so a malformed quote drops the whole batch to the fallbacks
+            batch = {quote['symbol']: quote for quote in result}
+            quotes.update(batch)
+        except (requests.exceptions.RequestException, ValueError, KeyError, IndexError, TypeError) as e:
+            print(f"Could not get quotes: {e}")
+    return quotes
+
+def get_current_price(ticker, session, quotes_map):
+    """
+    Gets the current price of a ticker based on the market session from pre-fetched quotes.
+    """
+    quote = quotes_map.get(ticker)
+    if not quote:
+        return None
+    ask_price = quote.get('ask')
+    if ask_price:
+        return ask_price
+    elif session == 'pre-market':
+        return quote.get('preMarketPrice')
+    elif session == 'post-market':
+        return quote.get('postMarketPrice')
     else:
-        return "closed"
+        return quote.get('regularMarketPrice')
 
-def get_current_price(ticker, session):
+def _yahoo_chart_close(tickers, session='regular', apilog=False):
     """
-    Gets the current price of a ticker based on the market session.
+    Gets the previous close and last price of each ticker from Yahoo's chart endpoint as plain
+    floats, without building a DataFrame. During pre-market and post-market the last price is
+    the latest extended-hours minute bar. The endpoint takes one symbol per request, so the
+    requests run concurrently. Returns a dictionary of ticker to (previous_close, last_close);
+    either may be None, and tickers whose request failed are omitted.
     """
-    try:
-        stock_info = yf.Ticker(ticker).info
-        ask_price = stock_info.get('ask')
-        if ask_price:
-            return ask_price
-        elif session == 'pre-market':
-            return stock_info.get('preMarketPrice')
-        elif session == 'post-market':
-            return stock_info.get('postMarketPrice')
+    extended = session in ('pre-market', 'post-market')
+    if extended:
+        params = {"range": "1d", "interval": "1m", "includePrePost": "true"}
+    else:
+        params = {"range": "2d", "interval": "1d"}
+
+    def fetch(ticker):
+        url = YAHOO_CHART_URL + urllib.parse.quote(ticker)
+        try:
+            if apilog:
+                log_api(f"Request: GET {url}?{urllib.parse.urlencode(params)}")
+            response = _HTTP_SESSION.get(url, params=params, headers=YAHOO_HEADERS, timeout=10)
+            response.raise_for_status()
+            chart = response.json()['chart']['result'][0]
+            closes = [close for close in chart['indicators']['quote'][0].get('close', []) if close is not None]
+            if apilog:
+                log_api(f"Response: Received {len(closes)} closes for {ticker}.")
+        except (requests.exceptions.RequestException, ValueError, KeyError, IndexError, TypeError) as e:
+            print(f"Could not get chart data for {ticker}: {e}")
+            return None
+        meta = chart.get('meta', {})
+        if extended:
+            # The minute bars are all from today, so the previous close comes from the metadata
+            previous_close = meta.get('chartPreviousClose')
+            last_close = (closes[-1] if closes else None) or meta.get('regularMarketPrice')
         else:
-            return stock_info.get('regularMarketPrice')
-    except Exception as e:
-        print(f"Could not get current price for {ticker}: {e}")
-        return None
+            previous_close = closes[-2] if len(closes) >= 2 else meta.get('chartPreviousClose')
+            last_close = meta.get('regularMarketPrice') or (closes[-1] if closes else None)
+        return previous_close, last_close
+
+    results = _map_concurrent(fetch, tickers, MAX_DOWNLOAD_WORKERS)
+    return {ticker: result for ticker, result in zip(tickers, results) if result is not None}
+
+def _yfinance_last_prices(tickers, apilog=False):
+    """
+    Last resort for tickers the direct Yahoo endpoints failed on. yfinance goes through its own
+    cookie and crumb session, so it still works if Yahoo refuses the plain requests.
+    fast_info skips the heavy .info scrape; each lookup is its own request, so they run
+    concurrently. Returns a dictionary of ticker to (previous_close, last_price); tickers whose
+    lookup failed are omitted.
+    """
+    if apilog:
+        log_api(f"Request: yf.Tickers({' '.join(tickers)}).fast_info")
+    yf_tickers = yf.Tickers(" ".join(tickers))
+
+    def fetch(ticker):
+        try:
+            fast_info = yf_tickers.tickers[ticker].fast_info
+            return fast_info.get('regular_market_previous_close'), fast_info['last_price']
+        except Exception as e:
+            print(f"Could not get current price for {ticker}: {e}")
+            return None
+
+    results = _map_concurrent(fetch, tickers, MAX_DOWNLOAD_WORKERS)
+    return {ticker: result for ticker, result in zip(tickers, results) if result is not None}
+
+def get_current_prices(tickers, session, quotes_map, apilog=False):
+    """
+    Gets the current price of every ticker based on the market session.
+    Returns (prices, previous_closes): dictionaries of ticker to price, omitting tickers whose
+    price could not be found, and of ticker to the previous close reported by the fallback
+    for tickers missing from quotes_map.
+    """
+    prices = {}
+    previous_closes = {}
+    for ticker in tickers:
+        price = get_current_price(ticker, session, quotes_map)
+        if price:
+            prices[ticker] = price
+
+    def add_fallback(results):
+        for ticker, (previous_close, last_close) in results.items():
+            if last_close:
+                prices[ticker] = last_close
+            if previous_close:
+                previous_closes.setdefault(ticker, previous_close)
+
+    # Fall back to the chart endpoint for anything the quote endpoint didn't return
+    remaining = [ticker for ticker in tickers if ticker not in prices]
+    if remaining:
+        add_fallback(_yahoo_chart_close(remaining, session, apilog))
+
+    # Then to yfinance for anything the chart endpoint failed on too
+    remaining = [ticker for ticker in tickers if ticker not in prices]
+    if remaining:
+        add_fallback(_yfinance_last_prices(remaining, apilog))
+
+    return prices, previous_closes
+
+def get_previous_closes(tickers, apilog=False):
+    """
+    Gets the previous day's close of every ticker from Yahoo's spark endpoint, which returns
+    only daily closes, YAHOO_BATCH_SIZE symbols per request.
+    Returns a dictionary of ticker to close; tickers without two days of data are omitted.
+    """
+    previous_closes = {}
+    for i in range(0, len(tickers), YAHOO_BATCH_SIZE):
+        symbols_string = ",".join(tickers[i:i + YAHOO_BATCH_SIZE])
+        params = {"symbols": symbols_string, "range": "2d", "interval": "1d", "indicators": "close"}
+        try:
+            if apilog:
+                log_api(f"Request: GET {YAHOO_SPARK_URL}?symbols={symbols_string}&range=2d&interval=1d")
+            response = _HTTP_SESSION.get(YAHOO_SPARK_URL, params=params, headers=YAHOO_HEADERS, timeout=10)
+            response.raise_for_status()
+            spark = response.json()['spark']
+            result = spark['result']
+            # Yahoo reports errors with a null result and a 200 status
+            if not isinstance(result, list):
+                raise ValueError(f"no results ({spark.get('error')})")
+            if apilog:
+                log_api(f"Response: Received {len(result)} series.")
+        except (requests.exceptions.RequestException, ValueError, KeyError, TypeError) as e:
+            print(f"Could not get previous day's closes: {e}")
+            continue
+
+        for series in result:
+            try:
+                symbol = series['symbol']
+                closes = series['response'][0]['indicators']['quote'][0]['close']
+            except (KeyError, IndexError, TypeError):
+                continue
+            # Days without a trade come back as null, so use the last two that have data
+            closes = [close for close in closes if close is not None]
+            # A zero close would make the percent change infinite
+            if len(closes) >= 2 and closes[-2]:
+                previous_closes[symbol] = closes[-2]
+    return previous_closes
+
+# Integer codes for each direction in the array form of the watchlist
+_DIRECTION_CODES = {'both': 0, 'gain': 1, 'drop': 2}
+
+def _watchlist_arrays(watchlist):
+    """
+    Converts the watchlist into parallel NumPy arrays, one entry per ticker, so the alert
+    conditions can be evaluated for every ticker at once. Missing price targets become NaN.
+    The result is cached alongside the parsed watchlist.
+    """
+    if _WATCHLIST_CACHE['data'] is watchlist and _WATCHLIST_CACHE['arrays'] is not None:
+        return _WATCHLIST_CACHE['arrays']
+
+    configs = list(watchlist.values())
+    arrays = {
+        'tickers': list(watchlist),
+        'threshold': np.array([c['threshold'] for c in configs], dtype=float),
+        'direction': np.array([_DIRECTION_CODES[c['direction']] for c in configs], dtype=np.int8),
+        'price_below': np.array([np.nan if c['price_below'] is None else c['price_below'] for c in configs], dtype=float),
+        'price_above': np.array([np.nan if c['price_above'] is None else c['price_above'] for c in configs], dtype=float),
+    }
+    if _WATCHLIST_CACHE['data'] is watchlist:
+        _WATCHLIST_CACHE['arrays'] = arrays
+    return arrays
+
+def _alert_masks(arrays, current, previous):
+    """
+    Evaluates the alert conditions for every ticker at once.
+    Returns (percent_change, percentage_alert, below_alert, above_alert) arrays. Tickers with
+    a missing price have a NaN percent change and never trigger.
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        percent_change = ((current - previous) / previous) * 100
+
+    threshold = arrays['threshold']
+    direction = arrays['direction']
+    percentage_alert = np.where(direction == _DIRECTION_CODES['gain'], percent_change > threshold,
+                                np.where(direction == _DIRECTION_CODES['drop'], percent_change < -threshold,
+                                         np.abs(percent_change) > threshold))
+    # Comparisons against NaN are False, so tickers without a target never trigger
+    below_alert = current < arrays['price_below']
+    above_alert = current > arrays['price_above']
+    return percent_change, percentage_alert, below_alert, above_alert
+
+def _check_one(ticker, config, current_price, previous_close, percent_change, triggered, verbose=False):
+    """
+    Reports the result of checking a single ticker for unusual price changes and price targets.
+    percent_change and triggered, the (percentage, price below, price above) alert flags,
+    come from _alert_masks, so the figure shown is the one the alert was decided on.
+    Returns (output, alert): the lines to print for this ticker, and a
+    (message, ticker, alert_frequency) tuple combining every alert that was
+    triggered, or None if there were none.
+    """
+    output = []
+    alerts_for_ticker = []
+
+    threshold = config["threshold"]
+    direction = config["direction"]
+    price_below = config["price_below"]
+    price_above = config["price_above"]
+    alert_frequency = config["alert_frequency"]
+    percentage_alert, below_alert, above_alert = triggered
+
+    if current_price is None:
+        output.append(f"Could not get current price for {ticker}, skipping.")
+        return output, None
+
+    if previous_close is None:
+        output.append(f"Could not get enough historical data for {ticker}, skipping.")
+        return output, None
+
+    if verbose:
+        output.append(f"--- {ticker} ---")
+        output.append(f"Previous Close: {previous_close:.2f}")
+        output.append(f"Current Price: {current_price:.2f}")
+        output.append(f"Percent Change: {percent_change:.2f}%")
+        output.append(f"Threshold: {threshold}%")
+        output.append(f"Direction: {direction}")
+        if price_below:
+            output.append(f"Price Below: {price_below:.2f}")
+        if price_above:
+            output.append(f"Price Above: {price_above:.2f}")
+        output.append("---------------------")
+
+    # Percentage change alerts
+    if percentage_alert:
+        message = f"Unusual price change detected for {ticker}: {'+' if percent_change > 0 else ''}{percent_change:.2f}% (Threshold: {threshold}%, Direction: {direction}). Current Price: {current_price:.2f}"
+        alerts_for_ticker.append(message)
+
+    # Price target alerts
+    if below_alert:
+        message = f"{ticker} has dropped below your target of {price_below:.2f}. Current price: {current_price:.2f}"
+        alerts_for_ticker.append(message)
+    
+    if above_alert:
+        message = f"{ticker} has gone above your target of {price_above:.2f}. Current price: {current_price:.2f}"
+        alerts_for_ticker.append(message)
+
+    if not alerts_for_ticker:
+        return output, None
+
+    # Send co-occurring alerts as one, so the frequency check and notification happen once per ticker
+    return output, ("\n".join(alerts_for_ticker), ticker, alert_frequency)
 
 def check_stock_price_change(verbose=False, apilog=False):
     """
     Checks for unusual price changes in stocks listed in watchlist.txt.
     """
+    # Drop alerts queued by an earlier check that failed before sending them (e.g. a --daemon
+    # tick that raised), so their stale prices aren't sent with this check's alerts
+    _PENDING_ALERTS.clear()
+
     watchlist = parse_watchlist()
     if not watchlist:
         print("Watchlist is empty or not found.")
@@ -350,72 +1002,50 @@ def check_stock_price_change(verbose=False, apilog=False):
 
     print(f"Checking {session} prices...")
 
-    for ticker, config in watchlist.items():
-        threshold = config["threshold"]
-        direction = config["direction"]
-        price_below = config["price_below"]
-        price_above = config["price_above"]
-        alert_frequency = config["alert_frequency"]
+    # Every alert from this check is stamped with the time the check started
+    timestamp = _format_timestamp(datetime.datetime.now())
 
-        current_price = get_current_price(ticker, session)
+    quotes_map = _fetch_quotes_v7(list(watchlist), apilog)
+    current_prices, previous_closes = get_current_prices(list(watchlist), session, quotes_map, apilog)
 
-        if current_price is None:
-            print(f"Could not get current price for {ticker}, skipping.")
-            continue
+    # The quotes and the chart fallback already carry the previous close; only download
+    # history for symbols without it
+    for ticker in watchlist:
+        previous_close = quotes_map.get(ticker, {}).get('regularMarketPreviousClose')
+        if previous_close:
+            previous_closes[ticker] = previous_close
+    missing = [ticker for ticker in watchlist if ticker not in previous_closes]
+    if missing:
+        previous_closes.update(get_previous_closes(missing, apilog))
 
-        # Get previous day's close
-        try:
-            if apilog:
-                log_api(f"Request: yf.download(ticker={ticker}, period=\"2d\")")
-            data = yf.download(ticker, period="2d", auto_adjust=True, progress=False)
-            if apilog:
-                log_api(f"Response: Received {len(data)} rows of data.")
-            
-            if data.empty or len(data) < 2:
-                print(f"Could not get enough historical data for {ticker}, skipping.")
-                continue
+    # Evaluate every alert condition for the whole watchlist at once. The arrays stay float64,
+    # the same precision as the prices themselves.
+    arrays = _watchlist_arrays(watchlist)
+    tickers = arrays['tickers']
+    current = np.array([current_prices.get(ticker, np.nan) for ticker in tickers], dtype=float)
+    previous = np.array([previous_closes.get(ticker, np.nan) for ticker in tickers], dtype=float)
+    percent_change, percentage_alert, below_alert, above_alert = _alert_masks(arrays, current, previous)
 
-            previous_close = data['Close'].iloc[-2].item()
-        except Exception as e:
-            print(f"Could not get previous day's close for {ticker}: {e}")
-            continue
+    # Only tickers that alerted or are missing data need reporting, unless verbose output is on
+    if verbose:
+        to_report = range(len(tickers))
+    else:
+        to_report = np.flatnonzero(np.isnan(percent_change) | percentage_alert | below_alert | above_alert)
+
+    for i in to_report:
+        ticker = tickers[i]
+        current_price = current_prices.get(ticker)
+        previous_close = previous_closes.get(ticker)
+        triggered = (percentage_alert[i], below_alert[i], above_alert[i])
+        output, alert = _check_one(ticker, watchlist[ticker], current_price, previous_close, float(percent_change[i]), triggered, verbose)
+        for line in output:
+            print(line)
+        if alert:
+            message, ticker, alert_frequency = alert
+            log_alert(message, ticker, alert_frequency, timestamp)
 
-        percent_change = ((current_price - previous_close) / previous_close) * 100
-
-        if verbose:
-            print(f"--- {ticker} ---")
-            print(f"Previous Close: {previous_close:.2f}")
-            print(f"Current Price: {current_price:.2f}")
-            print(f"Percent Change: {percent_change:.2f}%")
-            print(f"Threshold: {threshold}%")
-            print(f"Direction: {direction}")
-            if price_below:
-                print(f"Price Below: {price_below:.2f}")
-            if price_above:
-                print(f"Price Above: {price_above:.2f}")
-            print("---------------------")
-
-        # Percentage change alerts
-        percentage_alert = False
-        if direction == 'both' and abs(percent_change) > threshold:
-            percentage_alert = True
-        elif direction == 'gain' and percent_change > threshold:
-            percentage_alert = True
-        elif direction == 'drop' and percent_change < -threshold:
-            percentage_alert = True
-
-        if percentage_alert:
-            message = f"Unusual price change detected for {ticker}: {'+' if percent_change > 0 else ''}{percent_change:.2f}% (Threshold: {threshold}%, Direction: {direction}). Current Price: {current_price:.2f}"
-            log_alert(message, ticker, alert_frequency)
-
-        # Price target alerts
-        if price_below is not None and current_price < price_below:
-            message = f"{ticker} has dropped below your target of {price_below:.2f}. Current price: {current_price:.2f}"
-            log_alert(message, ticker, alert_frequency)
-        
-        if price_above is not None and current_price > price_above:
-            message = f"{ticker} has gone above your target of {price_above:.2f}. Current price: {current_price:.2f}"
-            log_alert(message, ticker, alert_frequency)
+    _flush_alerts()
+    _flush_logs()
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Monitor stock prices for unusual changes.")
@@ -423,6 +1053,7 @@ if __name__ == "__main__":
     parser.add_argument("--testpush", action="store_true", help="Send a test notification to Pushover.")
     parser.add_argument("--analyze", action="store_true", help="Analyze stocks in the watchlist.")
     parser.add_argument("--apilog", action="store_true", help="Log all API requests to api_log.txt.")
+    parser.add_argument("--daemon", action="store_true", help=f"Keep running and check prices every {DAEMON_INTERVAL} seconds.")
     args = parser.parse_args()
 
 
@@ -433,5 +1064,21 @@ if __name__ == "__main__":
     if args.testpush:
         test_pushover()
         exit()
+
+    if args.daemon:
+        if BlockingScheduler is None:
+            print("--daemon requires APScheduler. Please install it using: pip install apscheduler")
+            exit(1)
+        # One long-running process keeps the HTTP session, parsed watchlist and alert state
+        # between checks. The first check runs immediately; overlapping checks are skipped.
+        scheduler = BlockingScheduler()
+        scheduler.add_job(check_stock_price_change, 'interval', seconds=DAEMON_INTERVAL,
+                          args=(args.verbose, args.apilog), next_run_time=datetime.datetime.now(),
+                          max_instances=1, coalesce=True)
+        try:
+            scheduler.start()
+        except (KeyboardInterrupt, SystemExit):
+            pass
+        exit()
     
     check_stock_price_change(args.verbose, args.apilog)